@@ -83,3 +83,40 @@ def get_merkle_root(leaves: Sequence[Hash32]) -> Hash32:
     Return the Merkle root of the given 32-byte hashes.
     """
     return get_root(calc_merkle_tree_from_leaves(leaves))
+
+
+def get_root_from_packed_leaves(leaves: bytes, depth: int) -> Hash32:
+    """
+    Return the root of the tree of the given ``depth`` whose leaves are the 32-byte chunks
+    of ``leaves``, padded with empty leaves.
+
+    The tree is hashed bottom-up inside a single buffer: every parent layer overwrites
+    the front of its child layer, so no intermediate tree is built.
+
+    ``depth`` may not exceed ``TreeDepth``, the number of precomputed empty node hashes.
+    """
+    if depth > TreeDepth:
+        raise ValueError(f"Tree depth {depth} exceeds the maximum of {TreeDepth}")
+    if len(leaves) % 32 != 0:
+        raise ValueError("Leaves must be a sequence of 32-byte chunks")
+    if len(leaves) > 32 * 2 ** depth:
+        raise ValueError(f"Too many leaves for a tree of depth {depth}")
+    if len(leaves) == 0:
+        if depth < TreeDepth:
+            return EmptyNodeHashes[depth]
+        # a single empty leaf has the same root, and needs no empty hash at ``depth``
+        leaves = EmptyNodeHashes[0]
+
+    # one spare chunk to pad a layer with an odd number of nodes
+    buffer = bytearray(len(leaves) + 32)
+    buffer[: len(leaves)] = leaves
+    view = memoryview(buffer)
+    layer_length = len(leaves)
+    for i in range(depth):
+        if layer_length % 64 != 0:
+            buffer[layer_length : layer_length + 32] = EmptyNodeHashes[i]
+            layer_length += 32
+        for start in range(0, layer_length, 64):
+            buffer[start // 2 : start // 2 + 32] = hash_eth2(view[start : start + 64])
+        layer_length //= 2
+    return Hash32(bytes(buffer[:32]))
@@ -1,11 +1,14 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
 from eth.constants import ZERO_HASH32
 from eth_typing import Hash32
 from eth_utils import humanize_hash
 import ssz
+from ssz.exceptions import SerializationError
 from ssz.sedes import Vector, bytes32
 
+from eth2._utils.merkle.common import _calc_parent_hash
+from eth2._utils.merkle.sparse import EmptyNodeHashes, get_root_from_packed_leaves
 from eth2.beacon.constants import DEPOSIT_CONTRACT_TREE_DEPTH
 
 from .defaults import default_tuple_of_size
@@ -15,6 +18,14 @@ DEPOSIT_PROOF_VECTOR_SIZE = DEPOSIT_CONTRACT_TREE_DEPTH + 1
 
 default_proof_tuple = default_tuple_of_size(DEPOSIT_PROOF_VECTOR_SIZE, ZERO_HASH32)
 
+_proof_sedes = Vector(bytes32, DEPOSIT_PROOF_VECTOR_SIZE)
+# depth of the tree the proof vector is merkleized into, once padded to a power of two
+_proof_tree_depth = (DEPOSIT_PROOF_VECTOR_SIZE - 1).bit_length()
+
+# The default proof consists only of zero chunks, so its root is the root of an empty subtree
+# as deep as the (power-of-two padded) proof vector.
+_default_proof_root = EmptyNodeHashes[_proof_tree_depth]
+
 
 class Deposit(ssz.Serializable):
     """
@@ -25,7 +36,7 @@ class Deposit(ssz.Serializable):
 
     fields = [
         # Merkle path to deposit root
-        ("proof", Vector(bytes32, DEPOSIT_PROOF_VECTOR_SIZE)),
+        ("proof", _proof_sedes),
         ("data", DepositData),
     ]
 
@@ -36,6 +47,48 @@ class Deposit(ssz.Serializable):
     ) -> None:
         super().__init__(proof, data)
 
+    # A ``Deposit`` is never mutated after construction (``copy`` builds a new instance),
+    # so both roots can be memoized on the instance.
+    # NOTE: declaring ``__slots__`` would not save the per-instance ``__dict__``:
+    # ``ssz.Serializable`` has no slots itself, stores the field values and its cache in
+    # ``__dict__`` and relies on it in ``__getstate__`` and ``__deepcopy__``.
+    _hash_tree_root_cache: Optional[Hash32] = None
+    _proof_root_cache: Optional[Hash32] = None
+
+    @property
+    def proof_root(self) -> Hash32:
+        if self._proof_root_cache is None:
+            if self.proof is default_proof_tuple:
+                self._proof_root_cache = _default_proof_root
+            else:
+                # reject malformed proofs like ssz does when hashing the container
+                if len(self.proof) != DEPOSIT_PROOF_VECTOR_SIZE:
+                    raise SerializationError(
+                        f"Deposit proof has {len(self.proof)} elements, "
+                        f"expected {DEPOSIT_PROOF_VECTOR_SIZE}"
+                    )
+                if any(len(node) != 32 for node in self.proof):
+                    raise SerializationError("Deposit proof elements must be 32 bytes")
+                # the proof elements are already the 32-byte leaves of the vector
+                self._proof_root_cache = get_root_from_packed_leaves(
+                    b"".join(self.proof), _proof_tree_depth
+                )
+        return self._proof_root_cache
+
+    @property
+    def hash_tree_root(self) -> Hash32:
+        # A two-field container merkleizes to the parent hash of its field roots.
+        if self._hash_tree_root_cache is None:
+            self._hash_tree_root_cache = _calc_parent_hash(
+                self.proof_root, self.data.hash_tree_root
+            )
+        return self._hash_tree_root_cache
+
+    def reset_cache(self) -> None:
+        super().reset_cache()
+        self._hash_tree_root_cache = None
+        self._proof_root_cache = None
+
     def __str__(self) -> str:
         return (
             f"[hash_tree_root]={humanize_hash(self.hash_tree_root)}, data=({self.data})"
@@ -55,6 +55,7 @@ deps = {
         "hypothesis>=4.24.3,<5",
         "pexpect>=4.6, <5",
         "factory-boy==2.12.0",
+        "orjson>=2.0.0,<4",
         # pinned to <3.7 until async fixtures work again
         # https://github.com/pytest-dev/pytest-asyncio/issues/89
         "pytest>=3.6,<3.7",
@@ -1,3 +1,7 @@
+import pytest
+import ssz
+from ssz.exceptions import SerializationError
+
 from eth2.beacon.types.deposits import Deposit
 
 
@@ -5,3 +9,59 @@ def test_defaults(sample_deposit_params):
     deposit = Deposit(**sample_deposit_params)
 
     assert deposit.data == sample_deposit_params["data"]
+
+
+def test_default_proof_is_shared():
+    assert Deposit().proof is Deposit().proof
+
+
+def test_hash_tree_root(sample_deposit_params):
+    deposit = Deposit(**sample_deposit_params)
+    expected_root = ssz.get_hash_tree_root(deposit, sedes=Deposit)
+
+    assert deposit.hash_tree_root == expected_root
+    assert deposit._hash_tree_root_cache == expected_root
+    assert deposit._proof_root_cache == ssz.get_hash_tree_root(
+        deposit.proof, sedes=Deposit._meta.container_sedes.field_sedes[0]
+    )
+    assert deposit.copy().hash_tree_root == expected_root
+
+    deposit.reset_cache()
+    assert deposit._hash_tree_root_cache is None
+    assert deposit._proof_root_cache is None
+    assert deposit.hash_tree_root == expected_root
+
+
+def test_hash_tree_root_is_memoized(sample_deposit_params, monkeypatch):
+    deposit = Deposit(**sample_deposit_params)
+    expected_root = deposit.hash_tree_root
+
+    def fail(*args):
+        raise AssertionError("memoized root was hashed again")
+
+    monkeypatch.setattr("eth2.beacon.types.deposits._calc_parent_hash", fail)
+    monkeypatch.setattr("eth2.beacon.types.deposits.get_root_from_packed_leaves", fail)
+
+    assert deposit.hash_tree_root == expected_root
+
+
+def test_default_proof_root():
+    deposit = Deposit()
+    proof_sedes = Deposit._meta.container_sedes.field_sedes[0]
+
+    assert deposit.proof_root == ssz.get_hash_tree_root(
+        deposit.proof, sedes=proof_sedes
+    )
+    assert deposit.hash_tree_root == ssz.get_hash_tree_root(deposit, sedes=Deposit)
+
+
+@pytest.mark.parametrize(
+    "proof", ((b"\x22" * 32,) * 32, (b"\x22" * 32,) * 32 + (b"\x22" * 31,))
+)
+def test_hash_tree_root_rejects_malformed_proof(sample_deposit_params, proof):
+    deposit = Deposit(proof=proof, data=sample_deposit_params["data"])
+
+    with pytest.raises(SerializationError):
+        ssz.get_hash_tree_root(deposit, sedes=Deposit)
+    with pytest.raises(SerializationError):
+        deposit.hash_tree_root
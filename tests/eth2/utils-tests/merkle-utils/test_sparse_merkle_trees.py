@@ -2,9 +2,13 @@ import pytest
 
 from eth2._utils.hash import hash_eth2
 from eth2._utils.merkle.sparse import (
+    EmptyNodeHashes,
+    TreeDepth,
     calc_merkle_tree,
+    calc_merkle_tree_from_leaves,
     get_merkle_proof,
     get_root,
+    get_root_from_packed_leaves,
     verify_merkle_proof,
 )
 
@@ -53,3 +57,29 @@ def test_merkle_root_and_proofs(items, expected_root):
             assert not verify_merkle_proof(
                 expected_root, hash_eth2(item), index, altered_proof
             )
+
+
+@pytest.mark.parametrize("leaf_count", (1, 2, 3, 4, 33))
+def test_get_root_from_packed_leaves(leaf_count):
+    leaves = tuple(hash_eth2(bytes([index])) for index in range(leaf_count))
+    expected_root = get_root(calc_merkle_tree_from_leaves(leaves))
+
+    assert get_root_from_packed_leaves(b"".join(leaves), TreeDepth) == expected_root
+
+
+def test_get_root_from_packed_leaves_empty():
+    assert get_root_from_packed_leaves(b"", 6) == EmptyNodeHashes[6]
+    assert get_root_from_packed_leaves(b"", TreeDepth) == hash_eth2(
+        EmptyNodeHashes[TreeDepth - 1] + EmptyNodeHashes[TreeDepth - 1]
+    )
+
+
+def test_get_root_from_packed_leaves_too_deep():
+    with pytest.raises(ValueError):
+        get_root_from_packed_leaves(b"\x01" * 32, TreeDepth + 1)
+
+
+@pytest.mark.parametrize("leaves", (b"\x01" * 31, b"\x01" * 32 * 3))
+def test_get_root_from_packed_leaves_invalid(leaves):
+    with pytest.raises(ValueError):
+        get_root_from_packed_leaves(leaves, 1)
@@ -1,8 +1,10 @@
 import asyncio
+import functools
 import json
 import os
 from pathlib import Path
 
+import orjson
 import pytest
 
 from eth_utils.toolz import (
@@ -35,7 +37,6 @@ from eth.chains.mainnet import (
 from eth.tools.fixtures import (
     filter_fixtures,
     generate_fixture_tests,
-    load_fixture,
     should_run_slow_tests,
 )
 
@@ -188,6 +189,17 @@ RPC_TRANSACTION_NORMALIZERS = {
 }
 
 
+# Like py-evm's ``load_json_fixture``, keep a small rolling cache of the loaded
+# files, as the tests from one fixture file are generated next to each other.
+@functools.lru_cache(maxsize=16)
+def load_json_fixture(fixture_path):
+    return orjson.loads(Path(fixture_path).read_bytes())
+
+
+def load_fixture(fixture_path, fixture_key):
+    return load_json_fixture(fixture_path)[fixture_key]
+
+
 def fixture_block_in_rpc_format(state):
     return {
         RPC_BLOCK_REMAPPERS.get(key, key):
@@ -212,23 +224,33 @@ def fixture_transaction_in_rpc_format(state):
 
 
 def blockchain_fixture_mark_fn(fixture_path, fixture_name, fixture_fork):
-    for slow_test in SLOW_TESTS:
-        if slow_test in fixture_path or slow_test in fixture_name:
-            if not should_run_slow_tests():
-                return pytest.mark.skip("skipping slow test on a quick run")
-            break
     if (fixture_path, fixture_name) in INCORRECT_UPSTREAM_TESTS:
         return pytest.mark.xfail(reason="Listed in INCORRECT_UPSTREAM_TESTS.")
 
 
+def blockchain_fixture_ignore_fn(fixture_path, fixture_key, fixture_fork):
+    # Slow tests are dropped at collection time on a quick run, so they are
+    # never parametrized or set up.
+    if should_run_slow_tests():
+        return False
+    return any(
+        slow_test in fixture_path or slow_test in fixture_key
+        for slow_test in SLOW_TESTS
+    )
+
+
 def generate_ignore_fn_for_fork(passed_fork):
     if passed_fork:
         normalized_fork = passed_fork.lower()
 
         def ignore_fn(fixture_path, fixture_key, fixture_fork):
-            return fixture_fork.lower() != normalized_fork
+            if fixture_fork.lower() != normalized_fork:
+                return True
+            return blockchain_fixture_ignore_fn(fixture_path, fixture_key, fixture_fork)
 
         return ignore_fn
+    else:
+        return blockchain_fixture_ignore_fn
 
 
 @to_tuple
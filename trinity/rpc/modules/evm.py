@@ -1,8 +1,10 @@
 from typing import (
-    Any
+    Any,
+    Dict,
 )
 
 from eth_utils import (
+    decode_hex,
     encode_hex,
 )
 from lahja import (
@@ -11,8 +13,8 @@ from lahja import (
 
 from eth.abc import ChainAPI
 from eth.tools._utils.normalization import (
-    normalize_block,
     normalize_blockchain_fixtures,
+    to_int,
 )
 from eth.tools.fixtures import (
     apply_fixture_block_to_chain,
@@ -28,6 +30,18 @@ from trinity.rpc.modules import (
 )
 
 
+def normalize_block_for_import(block: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize only the parts of a block fixture that are needed to import it: the
+    RLP-encoded block and the block number that selects the block class. Unlike
+    ``normalize_block`` this does not normalize every transaction of the block.
+    """
+    normalized_block: Dict[str, Any] = {'rlp': decode_hex(block['rlp'])}
+    if 'blockHeader' in block:
+        normalized_block['blockHeader'] = {'number': to_int(block['blockHeader']['number'])}
+    return normalized_block
+
+
 class EVM(Eth1ChainRPCModule):
 
     @format_params(normalize_blockchain_fixtures)
@@ -46,7 +60,7 @@ class EVM(Eth1ChainRPCModule):
 
         return chain
 
-    @format_params(normalize_block)
+    @format_params(normalize_block_for_import)
     async def applyBlockFixture(self, block_info: Any) -> str:
         """
         This method is a special case. It returns a new chain object